@@ -0,0 +1,59 @@
+"""
+Static pattern tables shared by the Edit|Write hooks.
+Kept in an importable module (not the hook scripts, which run as __main__) so
+CPython caches its bytecode in __pycache__ between hook runs.
+"""
+
+# Debug statements flagged by pre-commit-check.py
+DEBUG_PATTERNS = (
+    (r'\bconsole\.log\s*\(', "console.log", "Remove before commit, or use a proper logger (e.g., winston, pino)"),
+    (r'\bconsole\.debug\s*\(', "console.debug", "Remove before commit, or use a proper logger (e.g., winston, pino)"),
+    (r'\bdebugger\b', "debugger statement", "Remove before commit — debugger statements pause execution in production"),
+    (r'\bbreakpoint\s*\(', "breakpoint()", "Remove before commit — use a conditional breakpoint or logging instead"),
+    (r'\bpdb\.set_trace\s*\(', "pdb.set_trace()", "Remove before commit, or use a proper logger (e.g., logging module)"),
+)
+
+# Temporary markers flagged by pre-commit-check.py
+TEMP_MARKERS = (
+    (r'\bFIXME\b', "FIXME", "Address the issue or convert to a tracked GitHub issue"),
+    (r'\bHACK\b', "HACK", "Refactor the workaround or document why it is necessary in a comment"),
+    (r'\bXXX\b', "XXX", "Resolve the concern or convert to a tracked GitHub issue"),
+)
+
+# Literals at least one of which appears in any DEBUG_PATTERNS/TEMP_MARKERS
+# match; content containing none of them can skip the regex scan.
+CONTENT_LITERALS = ("console.", "debugger", "breakpoint", "pdb.", "FIXME", "HACK", "XXX")
+
+# Patterns that indicate potential secrets
+SECRET_PATTERNS = (
+    (r'(?i:(api[_-]?key|apikey)\s*[:=]\s*["\']?[a-zA-Z0-9_-]{20,})', "API key", "Move to .env file and use environment variables (e.g., process.env.API_KEY)"),
+    (r'(?i:(secret|password|passwd|pwd)\s*[:=]\s*["\'][^"\']+["\'])', "Password/Secret", "Use environment variables or a .env file, never hardcode credentials"),
+    (r"(?i:bearer\s+[a-zA-Z0-9_-]{20,})", "Bearer token", "Move to .env file and use environment variables (e.g., process.env.AUTH_TOKEN)"),
+    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token", "Move to .env file and use environment variables (e.g., process.env.GITHUB_TOKEN)"),
+    (r"github_pat_[a-zA-Z0-9]{22}_[a-zA-Z0-9]{59}", "GitHub PAT (fine-grained)", "Move to .env file and use environment variables (e.g., process.env.GITHUB_TOKEN)"),
+    (r"sk-[a-zA-Z0-9]{48}", "OpenAI API Key", "Move to .env file and use environment variables (e.g., process.env.OPENAI_API_KEY)"),
+    (r"sk-ant-[a-zA-Z0-9-]{90,}", "Anthropic API Key", "Move to .env file and use environment variables (e.g., process.env.ANTHROPIC_API_KEY)"),
+    (r"-----BEGIN (?:RSA |EC |DSA )?PRIVATE KEY-----", "Private key", "Store in a secrets manager (AWS Secrets Manager, Vault, etc.) — never commit private keys"),
+    (r"(?i:aws[_-]?access[_-]?key[_-]?id\s*[:=]\s*[A-Z0-9]{20})", "AWS Access Key", "Move to .env file and use environment variables (e.g., process.env.AWS_ACCESS_KEY_ID)"),
+    (
+        r"(?i:aws[_-]?secret[_-]?access[_-]?key\s*[:=]\s*[a-zA-Z0-9/+=]{40})",
+        "AWS Secret Key",
+        "Move to .env file and use environment variables (e.g., process.env.AWS_SECRET_ACCESS_KEY)",
+    ),
+)
+
+# Lowercase literals one of which must appear for SECRET_PATTERNS[i] to match,
+# indexed like SECRET_PATTERNS. Cheap substring checks rule patterns out
+# before any regex runs.
+SECRET_LITERALS = (
+    ("api_key", "api-key", "apikey"),
+    ("secret", "passw", "pwd"),
+    ("bearer",),
+    ("ghp_",),
+    ("github_pat_",),
+    ("sk-",),
+    ("sk-ant-",),
+    ("private key-----",),
+    ("aws",),
+    ("aws",),
+)
@@ -39,7 +39,7 @@ def get_formatter_command(file_path):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         file_path = input_data.get('tool_input', {}).get('file_path', '')
         
         if not file_path or not os.path.exists(file_path):
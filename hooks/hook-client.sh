@@ -0,0 +1,29 @@
+#!/usr/bin/env bash
+# Run a Python hook through the persistent hook daemon (hookd.py)
+# Usage: hook-client.sh <hook-name>
+# Falls back to running hooks/<hook-name>.py directly when the daemon or
+# socat is unavailable, so behaviour is identical either way.
+
+HOOK="$1"
+HOOKS_DIR="$(cd "$(dirname "$0")" && pwd)"
+SOCKET="${CLAUDE_HOOKD_SOCKET:-$HOME/.claude/hookd.sock}"
+
+# Read JSON from stdin (needed again for the fallback)
+INPUT=$(cat)
+
+if [ -S "$SOCKET" ] && command -v socat &> /dev/null; then
+    REPLY=$( { printf '%s\n%s\n' "$HOOK" "$HOOKS_DIR"; printf '%s' "$INPUT"; } | socat -t 5 - "UNIX-CONNECT:$SOCKET" 2> /dev/null)
+
+    # Reply is "<exit code>\n<stdout>"; empty means the daemon didn't handle it
+    # (unknown hook, another plugin checkout, or hooks edited since it loaded)
+    if [[ "$REPLY" =~ ^[0-9]+ ]]; then
+        CODE="${REPLY%%$'\n'*}"
+        if [[ "$REPLY" == *$'\n'* ]]; then
+            OUTPUT="${REPLY#*$'\n'}"
+            [ -n "$OUTPUT" ] && printf '%s\n' "$OUTPUT"
+        fi
+        exit "$CODE"
+    fi
+fi
+
+printf '%s' "$INPUT" | python3 "$HOOKS_DIR/$HOOK.py"
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Persistent hook daemon.
+Keeps the Edit|Write PreToolUse hooks loaded in one long-lived process so each
+tool call skips interpreter startup, imports, and regex compilation.
+Started on SessionStart; hooks reach it through hook-client.sh.
+"""
+import contextlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.environ.get(
+    "CLAUDE_HOOKD_SOCKET", os.path.join(os.path.expanduser("~"), ".claude", "hookd.sock")
+)
+
+# Hooks served by the daemon (pure functions of their stdin payload)
+SERVED_HOOKS = ("protect-files", "security-check", "pre-commit-check")
+
+# Files whose edits make a running daemon stale
+WATCHED_FILES = tuple(f"{name}.py" for name in SERVED_HOOKS) + ("_patterns.py", "hookd.py")
+
+# Shut down after this many seconds without a request
+IDLE_TIMEOUT = 30 * 60
+# How often the accept loop checks for shutdown
+POLL_INTERVAL = 1
+MAX_PAYLOAD_SIZE = 64 * 1024 * 1024
+# Must stay under hook-client.sh's `socat -t 5` so the client gets a reply or falls back
+REQUEST_TIMEOUT = 4
+
+# Loaded before the worker pool forks, so workers inherit compiled patterns
+MODULES = {}
+SIGNATURE = None
+PING = "hookd-ping"
+
+
+def hooks_signature():
+    """Fingerprint the watched files by mtime and size."""
+    signature = []
+    for filename in WATCHED_FILES:
+        try:
+            st = os.stat(os.path.join(HOOKS_DIR, filename))
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def load_hooks():
+    """Import each served hook script as a module into MODULES."""
+    global SIGNATURE
+    SIGNATURE = hooks_signature()
+    for name in SERVED_HOOKS:
+        path = os.path.join(HOOKS_DIR, f"{name}.py")
+        spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        MODULES[name] = module
+
+
+def run_hook(name, payload):
+    """Run a hook's main() against payload in a pool worker; return (exit_code, stdout)."""
+    module = MODULES[name]
+    stdout = io.StringIO()
+    saved_stdin = sys.stdin
+    sys.stdin = io.TextIOWrapper(io.BytesIO(payload), encoding="utf-8")
+    code = 0
+    try:
+        with contextlib.redirect_stdout(stdout):
+            module.main()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        code = 0  # Never block on errors
+    finally:
+        sys.stdin = saved_stdin
+    return code, stdout.getvalue()
+
+
+def read_request(conn):
+    """Read "<hook-name>\\n<hooks-dir>\\n<payload>" until the client half-closes."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > MAX_PAYLOAD_SIZE:
+            return None, None, None
+        chunks.append(chunk)
+    name, _, rest = b"".join(chunks).partition(b"\n")
+    hooks_dir, _, payload = rest.partition(b"\n")
+    return (
+        name.decode("utf-8", errors="replace").strip(),
+        hooks_dir.decode("utf-8", errors="replace").strip(),
+        payload,
+    )
+
+
+def is_current():
+    """Check whether a daemon for this plugin checkout, with unchanged hooks, is running."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1)
+            probe.connect(SOCKET_PATH)
+            probe.sendall(f"{PING}\n{HOOKS_DIR}\n".encode("utf-8"))
+            probe.shutdown(socket.SHUT_WR)
+            return probe.recv(16) == b"ok"
+    except OSError:
+        return False
+
+
+def handle_connection(conn, pool, stop):
+    """Answer one client; the hook itself runs on the worker pool."""
+    with conn:
+        conn.settimeout(REQUEST_TIMEOUT)
+        try:
+            name, hooks_dir, payload = read_request(conn)
+            # Empty reply tells the client to run the script itself
+            if hooks_dir != HOOKS_DIR:
+                return
+            if hooks_signature() != SIGNATURE:
+                stop.set()  # Hooks were edited; the next SessionStart reloads
+                return
+            if name == PING:
+                # Round-trip the pool so a daemon with dead workers reports stale
+                pool.submit(int).result(timeout=REQUEST_TIMEOUT)
+                conn.sendall(b"ok")
+                return
+            if name not in MODULES:
+                return
+            code, output = pool.submit(run_hook, name, payload).result(timeout=REQUEST_TIMEOUT)
+            conn.sendall(f"{code}\n{output}".encode("utf-8"))
+        except BrokenProcessPool:
+            stop.set()  # A worker died; the pool can't recover, so let SessionStart replace us
+        except Exception:
+            pass
+
+
+def owns_socket(inode):
+    """Check whether SOCKET_PATH is still the socket this daemon bound."""
+    try:
+        return os.stat(SOCKET_PATH).st_ino == inode
+    except OSError:
+        return False
+
+
+def serve():
+    """Accept requests until idle for IDLE_TIMEOUT seconds, stale, or replaced.
+
+    Each connection gets a thread and each hook run a worker process, so
+    parallel hooks and batch edits scan concurrently across cores.
+    """
+    os.makedirs(os.path.dirname(SOCKET_PATH), exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(SOCKET_PATH)
+
+    # Fork workers now, before any handler thread exists; one per served hook
+    # is enough for the parallel PreToolUse hooks
+    pool = ProcessPoolExecutor(
+        max_workers=min(len(SERVED_HOOKS), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("fork"),
+    )
+    pool.submit(int).result()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)  # Socket is only reachable by this user
+    try:
+        server.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(POLL_INTERVAL)
+    inode = os.stat(SOCKET_PATH).st_ino
+
+    stop = threading.Event()
+    last_request = time.monotonic()
+    try:
+        while not stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if time.monotonic() - last_request > IDLE_TIMEOUT or not owns_socket(inode):
+                    break
+                continue
+            last_request = time.monotonic()
+            threading.Thread(
+                target=handle_connection, args=(conn, pool, stop), daemon=True
+            ).start()
+    finally:
+        server.close()
+        # A newer daemon may have taken over the path; leave its socket alone
+        if owns_socket(inode):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(SOCKET_PATH)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def daemonize():
+    """Detach from the hook runner so SessionStart returns immediately."""
+    if os.fork() > 0:
+        os._exit(0)
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+    os.chdir("/")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+
+def main():
+    try:
+        # Without socat the client never connects, so don't start at all
+        if shutil.which("socat") is None:
+            sys.exit(0)
+
+        # A stale or foreign daemon is replaced; serve() takes over the socket path
+        if is_current():
+            sys.exit(0)
+
+        load_hooks()
+
+        if "--foreground" not in sys.argv:
+            if not hasattr(os, "fork"):
+                sys.exit(0)
+            daemonize()
+
+        serve()
+
+    except Exception:
+        pass  # Hooks fall back to running directly
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
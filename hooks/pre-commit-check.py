@@ -4,60 +4,63 @@ Pre-commit quality check hook.
 Detects debug statements, temporary markers, and large file content.
 Runs on PreToolUse for Edit|Write operations.
 """
+import functools
 import json
 import re
 import sys
-import os
 
+from _patterns import CONTENT_LITERALS, DEBUG_PATTERNS, TEMP_MARKERS
 
-DEBUG_PATTERNS = [
-    (r'\bconsole\.log\s*\(', "console.log", "Remove before commit, or use a proper logger (e.g., winston, pino)"),
-    (r'\bconsole\.debug\s*\(', "console.debug", "Remove before commit, or use a proper logger (e.g., winston, pino)"),
-    (r'\bdebugger\b', "debugger statement", "Remove before commit — debugger statements pause execution in production"),
-    (r'\bbreakpoint\s*\(', "breakpoint()", "Remove before commit — use a conditional breakpoint or logging instead"),
-    (r'\bpdb\.set_trace\s*\(', "pdb.set_trace()", "Remove before commit, or use a proper logger (e.g., logging module)"),
-]
-
-TEMP_MARKERS = [
-    (r'\bFIXME\b', "FIXME", "Address the issue or convert to a tracked GitHub issue"),
-    (r'\bHACK\b', "HACK", "Refactor the workaround or document why it is necessary in a comment"),
-    (r'\bXXX\b', "XXX", "Resolve the concern or convert to a tracked GitHub issue"),
-]
+_CONTENT_ISSUES = (
+    [f"Debug statement found: {name} → {suggestion}" for _, name, suggestion in DEBUG_PATTERNS]
+    + [f"Temporary marker found: {name} → {suggestion}" for _, name, suggestion in TEMP_MARKERS]
+)
 
 MAX_CONTENT_SIZE = 500 * 1024
-SKIP_EXTENSIONS = {'.md', '.markdown', '.txt', '.rst', '.json', '.yml', '.yaml'}
-
 
-def should_skip(file_path):
-    basename = os.path.basename(file_path).lower()
-    ext = os.path.splitext(file_path)[1].lower()
 
-    if ext in SKIP_EXTENSIONS:
-        return True
+@functools.lru_cache(maxsize=None)
+def content_regex():
+    """Single alternation over every pattern; group p<i> is _CONTENT_ISSUES[i].
 
-    if 'test' in basename or 'spec' in basename:
-        return True
+    Compiled on first scan (once per process, or once per hookd lifetime) so
+    skipped files never pay for it.
+    """
+    return re.compile('|'.join(
+        f'(?P<p{i}>{pattern})'
+        for i, (pattern, _, _) in enumerate(DEBUG_PATTERNS + TEMP_MARKERS)
+    ))
 
-    path_lower = file_path.lower()
-    if '/tests/' in path_lower or '/test/' in path_lower or '/__tests__/' in path_lower:
-        return True
-    if 'example' in path_lower or '/examples/' in path_lower:
-        return True
 
-    return False
+# Docs/config extensions, test/spec basenames, test directories, examples
+_SKIP_RE = re.compile(
+    r'\.(?:md|markdown|txt|rst|json|ya?ml)\Z'
+    r'|(?:test|spec)[^/]*\Z'
+    r'|/(?:tests?|__tests__)/'
+    r'|example'
+)
 
 
-def check_content(content):
-    issues = []
-    for pattern, name, suggestion in DEBUG_PATTERNS:
-        if re.search(pattern, content):
-            issues.append(f"Debug statement found: {name} → {suggestion}")
+def should_skip(file_path):
+    return _SKIP_RE.search(file_path.lower()) is not None
 
-    for pattern, name, suggestion in TEMP_MARKERS:
-        if re.search(pattern, content):
-            issues.append(f"Temporary marker found: {name} → {suggestion}")
 
-    content_size = len(content.encode('utf-8', errors='replace'))
+def check_content(content):
+    seen = set()
+    # Most edits touch a few identifiers; plain substring checks rule them out
+    if any(literal in content for literal in CONTENT_LITERALS):
+        for match in content_regex().finditer(content):
+            seen.add(int(match.lastgroup[1:]))
+            if len(seen) == len(_CONTENT_ISSUES):
+                break
+    issues = [_CONTENT_ISSUES[i] for i in sorted(seen)]
+
+    # UTF-8 uses at most 4 bytes per character, so short content can't exceed
+    # the limit and doesn't need encoding just to be measured.
+    if len(content) * 4 > MAX_CONTENT_SIZE:
+        content_size = len(content.encode('utf-8', errors='replace'))
+    else:
+        content_size = len(content)
     if content_size > MAX_CONTENT_SIZE:
         size_kb = content_size // 1024
         issues.append(f"Large file content: {size_kb}KB (limit: {MAX_CONTENT_SIZE // 1024}KB) → Consider splitting into smaller modules or extracting data")
@@ -67,7 +70,7 @@ def check_content(content):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         tool_input = input_data.get('tool_input', {})
 
         file_path = tool_input.get('file_path', '')
@@ -6,6 +6,7 @@ Blocks edits to production configs, lock files, and sensitive directories.
 import json
 import sys
 import os
+import re
 import fnmatch
 
 # Files/patterns to protect (exit code 2 = block)
@@ -47,26 +48,41 @@ WARN_PATTERNS = [
     '**/production/*',
 ]
 
-def matches_pattern(file_path, patterns):
+
+def compile_patterns(patterns):
+    """Compile globs into one anchored alternation; group _pat<i> is patterns[i].
+
+    fnmatch.translate emits its own g<n> groups on Python < 3.11, so the
+    wrapper names must not collide with them.
+    """
+    return re.compile('|'.join(
+        f'(?P<_pat{i}>{fnmatch.translate(pattern)})' for i, pattern in enumerate(patterns)
+    ))
+
+PROTECTED_RE = compile_patterns(PROTECTED_PATTERNS)
+WARN_RE = compile_patterns(WARN_PATTERNS)
+
+def matches_pattern(file_path, patterns, pattern_re):
     """Check if file matches any protected pattern."""
     file_path = file_path.lstrip('./')
-    for pattern in patterns:
-        if fnmatch.fnmatch(file_path, pattern):
-            return pattern
-        if fnmatch.fnmatch(os.path.basename(file_path), pattern):
-            return pattern
-    return None
+    basename = os.path.basename(file_path)
+    # Alternatives are tried in order, so each match is the earliest pattern
+    # for that string; the earlier of the two wins, as in a per-pattern loop.
+    # A bare filename is its own basename, so one match covers both.
+    candidates = (file_path,) if basename == file_path else (file_path, basename)
+    hits = [int(m.lastgroup[4:]) for m in map(pattern_re.match, candidates) if m]
+    return patterns[min(hits)] if hits else None
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         file_path = input_data.get('tool_input', {}).get('file_path', '')
         
         if not file_path:
             sys.exit(0)
         
         # Check for blocked patterns
-        blocked = matches_pattern(file_path, PROTECTED_PATTERNS)
+        blocked = matches_pattern(file_path, PROTECTED_PATTERNS, PROTECTED_RE)
         if blocked:
             reason = PROTECTED_REASONS.get(blocked, "This file is protected from edits")
             print(f"BLOCKED: {file_path}")
@@ -76,7 +92,7 @@ def main():
             sys.exit(2)  # Block the operation
         
         # Check for warning patterns
-        warned = matches_pattern(file_path, WARN_PATTERNS)
+        warned = matches_pattern(file_path, WARN_PATTERNS, WARN_RE)
         if warned:
             print(f"⚠️ WARNING: Editing sensitive file: {file_path}")
             print(f"   Matches pattern: {warned}")
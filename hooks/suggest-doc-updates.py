@@ -5,17 +5,61 @@ Detects significant changes and suggests CLAUDE.md/AGENTS.md updates.
 Runs on Stop event. Informational only - never blocks.
 """
 
+import functools
 import json
 import os
-import subprocess
 import sys
+from typing import Optional
+
+
+# Basenames (or basename prefixes) of configuration files
+CONFIG_PATTERNS = (
+    "package.json",
+    "tsconfig.json",
+    "pyproject.toml",
+    "Cargo.toml",
+    "go.mod",
+    "Makefile",
+    "Dockerfile",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    ".eslintrc",
+    ".prettierrc",
+    "webpack.config",
+    "vite.config",
+    "next.config",
+    "tailwind.config",
+    "jest.config",
+    "vitest.config",
+    ".env.example",
+    "requirements.txt",
+    "setup.py",
+    "setup.cfg",
+)
+
+# Top-level tool directories skipped when scanning the worktree for edits
+PRUNED_DIRS = frozenset({".git", ".claude", "node_modules"})
+
+# Past this many entries the scan gives up and git status decides
+MAX_SCAN_ENTRIES = 5000
+
+# Don't take .git/index.lock while the user runs git
+COMMAND_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
 
 
 def run_command(cmd: list[str], timeout: int = 15) -> tuple[bool, str]:
     """Run a command and return (success, output)."""
+    # Imported here so the no-changes fast path never loads subprocess
+    import subprocess
+
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout, cwd=os.getcwd()
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=os.getcwd(),
+            env=COMMAND_ENV,
         )
         return result.returncode == 0, result.stdout.strip()
     except subprocess.TimeoutExpired:
@@ -26,133 +70,205 @@ def run_command(cmd: list[str], timeout: int = 15) -> tuple[bool, str]:
         return False, str(e)
 
 
-def get_diff_stat() -> list[str]:
-    """Get git diff --stat lines for changes since HEAD."""
-    success, output = run_command(["git", "diff", "--stat", "HEAD"])
+def get_changed_files() -> list[tuple[str, str]]:
+    """Get changed files as (status, path) pairs (staged, unstaged, and untracked).
+
+    Uses a single NUL-delimited `git status --porcelain=v2` call, so paths are
+    never quoted or split on unusual characters.
+    """
+    success, output = run_command(
+        ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"]
+    )
     if not success or not output:
-        # Also check for untracked files
-        success2, output2 = run_command(["git", "status", "--porcelain"])
-        if success2 and output2:
-            return output2.split("\n")
         return []
-    return output.split("\n")
 
-
-def get_changed_files() -> list[str]:
-    """Get list of changed file paths (staged, unstaged, and untracked)."""
     files = []
-
-    # Staged and unstaged changes
-    success, output = run_command(["git", "diff", "--name-status", "HEAD"])
-    if success and output:
-        for line in output.split("\n"):
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                files.append(line)
-
-    # Untracked files
-    success, output = run_command(["git", "ls-files", "--others", "--exclude-standard"])
-    if success and output:
-        for f in output.split("\n"):
-            if f.strip():
-                files.append(f"A\t{f.strip()}")
+    records = iter(output.split("\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == "?":
+            files.append(("A", record[2:]))
+        elif kind == "1":
+            # 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+            fields = record.split(" ", 8)
+            if len(fields) == 9:
+                xy = fields[1]
+                if xy[0] == "A":
+                    # Added then removed from the worktree never existed at HEAD
+                    if xy[1] != "D":
+                        files.append(("A", fields[8]))
+                else:
+                    files.append(("D" if "D" in xy else "M", fields[8]))
+        elif kind == "2":
+            # 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <Xscore> <path>\0<origPath>
+            fields = record.split(" ", 9)
+            next(records, None)
+            if len(fields) == 10:
+                files.append(("R", fields[9]))
+        elif kind == "u":
+            # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+            fields = record.split(" ", 10)
+            if len(fields) == 11:
+                files.append(("U", fields[10]))
 
     return files
 
 
-def detect_new_directories(changed_files: list[str]) -> list[str]:
-    """Detect new directories created (directories with only new files)."""
-    new_dirs = set()
-    for entry in changed_files:
-        parts = entry.split("\t", 1)
-        if len(parts) == 2:
-            status, filepath = parts
-            if status.startswith("A") or status.startswith("?"):
-                # Extract directory path
-                dir_path = os.path.dirname(filepath)
-                if dir_path:
-                    new_dirs.add(dir_path)
-    return sorted(new_dirs)
+def get_session_start(session_id: Optional[str]) -> Optional[float]:
+    """Get this session's start time as recorded by validate-environment.py."""
+    if not session_id:
+        return None
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    try:
+        with open(os.path.join(project_dir, ".claude", "session.json")) as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(session, dict) or session.get("session_id") != session_id:
+        return None
+    start = session.get("start")
+    return start if isinstance(start, (int, float)) else None
+
+
+def worktree_changed_since(since: float) -> bool:
+    """Check whether any file or directory in the worktree changed since `since`.
+
+    Directory mtimes move on create/delete/rename, so deletions are caught
+    too. Stops at the first hit, and reports a change once the walk passes
+    MAX_SCAN_ENTRIES so large trees fall back to git status.
+    """
+    root = os.getcwd()
+    try:
+        if os.stat(root).st_mtime >= since:
+            return True
+    except OSError:
+        return True
+
+    scanned = 0
+    pending = [root]
+    while pending:
+        path = pending.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                scanned += 1
+                if scanned > MAX_SCAN_ENTRIES:
+                    return True
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if path == root and entry.name in PRUNED_DIRS:
+                            continue
+                        pending.append(entry.path)
+                    if entry.stat(follow_symlinks=False).st_mtime >= since:
+                        return True
+                except OSError:
+                    continue
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_tracked_tree() -> tuple[frozenset[str], frozenset[str]]:
+    """Get (file extensions, directories) tracked at HEAD.
+
+    Cached in .claude/ until HEAD moves, so the tree is listed once per commit.
+    """
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    cache_file = os.path.join(project_dir, ".claude", ".tree-cache.json")
+
+    has_head, head = run_command(["git", "rev-parse", "HEAD"])
+    if not has_head:
+        return frozenset(), frozenset()
+
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)[head]
+        return frozenset(cached["extensions"]), frozenset(cached["directories"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    success, output = run_command(["git", "ls-tree", "-r", "--name-only", "-z", "HEAD"])
+    if not success:
+        return frozenset(), frozenset()
+
+    extensions = set()
+    directories = set()
+    for path in output.split("\0"):
+        if not path:
+            continue
+        extensions.add(os.path.splitext(path)[1])
+        # Every ancestor of a tracked file is a tracked directory
+        slash = path.rfind("/")
+        while slash > 0:
+            path = path[:slash]
+            if path in directories:
+                break
+            directories.add(path)
+            slash = path.rfind("/")
+    extensions.discard("")
 
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(
+                {head: {"extensions": sorted(extensions), "directories": sorted(directories)}},
+                f,
+            )
+    except OSError:
+        pass
 
-def detect_new_file_types(changed_files: list[str]) -> list[str]:
+    return frozenset(extensions), frozenset(directories)
+
+
+def detect_new_directories(changed_files: list[tuple[str, str]]) -> list[str]:
+    """Detect new directories (holding added files, not tracked at HEAD)."""
+    added_dirs = {
+        dir_path
+        for status, filepath in changed_files
+        if status == "A" and (dir_path := os.path.dirname(filepath))
+    }
+    if not added_dirs:
+        return []
+
+    _, tracked_dirs = get_tracked_tree()
+    return sorted(added_dirs - tracked_dirs)
+
+
+def detect_new_file_types(changed_files: list[tuple[str, str]]) -> list[str]:
     """Detect new file extensions introduced by the changes."""
-    new_extensions = set()
-
-    # Get existing file extensions in the repo
-    success, output = run_command(["git", "ls-files"])
-    existing_extensions = set()
-    if success and output:
-        for f in output.split("\n"):
-            ext = os.path.splitext(f)[1]
-            if ext:
-                existing_extensions.add(ext)
-
-    # Check changed files for new extensions
-    for entry in changed_files:
-        parts = entry.split("\t", 1)
-        if len(parts) == 2:
-            status, filepath = parts
-            if status.startswith("A") or status.startswith("?"):
-                ext = os.path.splitext(filepath)[1]
-                if ext and ext not in existing_extensions:
-                    new_extensions.add(ext)
-
-    return sorted(new_extensions)
-
-
-def detect_deleted_files(changed_files: list[str]) -> list[str]:
+    added_extensions = {
+        os.path.splitext(filepath)[1]
+        for status, filepath in changed_files
+        if status == "A"
+    }
+    added_extensions.discard("")
+
+    # Only consult the tracked tree when something was actually added
+    if not added_extensions:
+        return []
+
+    existing_extensions, _ = get_tracked_tree()
+    return sorted(added_extensions - existing_extensions)
+
+
+def detect_deleted_files(changed_files: list[tuple[str, str]]) -> list[str]:
     """Detect deleted files."""
-    deleted = []
-    for entry in changed_files:
-        parts = entry.split("\t", 1)
-        if len(parts) == 2:
-            status, filepath = parts
-            if status.startswith("D"):
-                deleted.append(filepath)
-    return deleted
+    return [filepath for status, filepath in changed_files if status == "D"]
 
 
-def detect_config_changes(changed_files: list[str]) -> list[str]:
+def detect_config_changes(changed_files: list[tuple[str, str]]) -> list[str]:
     """Detect modified configuration files."""
-    config_patterns = [
-        "package.json",
-        "tsconfig.json",
-        "pyproject.toml",
-        "Cargo.toml",
-        "go.mod",
-        "Makefile",
-        "Dockerfile",
-        "docker-compose.yml",
-        "docker-compose.yaml",
-        ".eslintrc",
-        ".prettierrc",
-        "webpack.config",
-        "vite.config",
-        "next.config",
-        "tailwind.config",
-        "jest.config",
-        "vitest.config",
-        ".env.example",
-        "requirements.txt",
-        "setup.py",
-        "setup.cfg",
+    # A tuple prefix check covers exact names too, in one C-level call
+    return [
+        filepath
+        for _, filepath in changed_files
+        if os.path.basename(filepath).startswith(CONFIG_PATTERNS)
     ]
 
-    modified_configs = []
-    for entry in changed_files:
-        parts = entry.split("\t", 1)
-        if len(parts) == 2:
-            _, filepath = parts
-            basename = os.path.basename(filepath)
-            for pattern in config_patterns:
-                if basename == pattern or basename.startswith(pattern):
-                    modified_configs.append(filepath)
-                    break
-    return modified_configs
 
-
-def count_changed_files(changed_files: list[str]) -> int:
+def count_changed_files(changed_files: list[tuple[str, str]]) -> int:
     """Count the total number of changed files."""
     return len(changed_files)
 
@@ -162,10 +278,16 @@ def main():
     try:
         # Read stdin (Stop event data) - consume it even if unused
         try:
-            input_data = json.load(sys.stdin)
+            input_data = json.loads(sys.stdin.buffer.read())
         except Exception:
             input_data = {}
 
+        # Nothing touched since the session started: skip git entirely.
+        # Without a baseline for this session, git is the only source.
+        session_start = get_session_start(input_data.get("session_id"))
+        if session_start is not None and not worktree_changed_since(session_start):
+            sys.exit(0)
+
         # Gather change information
         changed_files = get_changed_files()
         if not changed_files:
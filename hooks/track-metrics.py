@@ -11,12 +11,23 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 
+PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+METRICS_FILE = os.path.join(PROJECT_DIR, ".claude", "agent-metrics.jsonl")
+
+# git diff must not refresh the index under a concurrent git command
+COMMAND_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
 
 def run_command(cmd: list[str], timeout: int = 10) -> tuple[bool, str]:
     """Run a command and return (success, output)."""
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout, cwd=os.getcwd()
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=os.getcwd(),
+            env=COMMAND_ENV,
         )
         return result.returncode == 0, result.stdout.strip()
     except Exception:
@@ -53,12 +64,31 @@ def get_latest_commit() -> str:
     return ""
 
 
+def append_line(path: str, line: bytes) -> None:
+    """Append line with a single O_APPEND write.
+
+    Appends of one write() are atomic for regular files on POSIX, so
+    concurrent hook runs can't interleave entries.
+    """
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        # First write in this project: create .claude/ and retry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, flags, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
 def main():
     """Log session metrics on Stop event."""
     try:
         # Read stdin JSON (Stop event data)
         try:
-            input_data = json.load(sys.stdin)
+            input_data = json.loads(sys.stdin.buffer.read())
         except Exception:
             input_data = {}
 
@@ -74,17 +104,8 @@ def main():
             "duration_hint": "completed",
         }
 
-        # Determine the metrics file path
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-        metrics_dir = os.path.join(project_dir, ".claude")
-        metrics_file = os.path.join(metrics_dir, "agent-metrics.jsonl")
-
-        # Ensure .claude/ directory exists
-        os.makedirs(metrics_dir, exist_ok=True)
-
         # Append the JSON line to the metrics file
-        with open(metrics_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_line(METRICS_FILE, f"{json.dumps(entry)}\n".encode("utf-8"))
 
     except Exception:
         pass  # Never block on errors
@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 """
 Post-edit TypeScript type checking hook.
-Runs tsc --noEmit after editing .ts/.tsx files.
+Runs incremental tsc --noEmit after editing .ts/.tsx files.
 Informational only - never blocks operations.
 """
+import hashlib
 import json
 import subprocess
 import sys
 import os
+import time
 
 
 TS_EXTENSIONS = {'.ts', '.tsx'}
+TSC_TIMEOUT = 30
 
 
 def find_tsconfig(file_path):
@@ -23,9 +26,23 @@ def find_tsconfig(file_path):
     return None
 
 
+def acquire_lock(lock_file):
+    """Create lock_file unless another tsc run holds it; stale locks are reclaimed."""
+    try:
+        if time.time() - os.path.getmtime(lock_file) > TSC_TIMEOUT * 2:
+            os.remove(lock_file)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except OSError:
+        return False
+
+
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         tool_input = input_data.get('tool_input', {})
 
         file_path = tool_input.get('file_path', '')
@@ -36,18 +53,36 @@ def main():
         if ext not in TS_EXTENSIONS:
             sys.exit(0)
 
+        if 'node_modules' in file_path.replace('\\', '/').split('/'):
+            sys.exit(0)
+
         tsconfig = find_tsconfig(file_path)
         if not tsconfig:
             sys.exit(0)
 
         project_dir = os.path.dirname(tsconfig)
+        # State lives in the session's .claude/, keyed per tsconfig, so
+        # monorepo packages don't each grow their own .claude/ directory
+        state_dir = os.path.join(os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd()), '.claude')
+        os.makedirs(state_dir, exist_ok=True)
+        key = hashlib.sha1(os.path.abspath(tsconfig).encode('utf-8')).hexdigest()[:12]
+
+        # Don't stack full-project checks; the next edit checks again
+        lock_file = os.path.join(state_dir, f'.tsc-{key}.inflight')
+        if not acquire_lock(lock_file):
+            sys.exit(0)
 
         try:
+            # Incremental build info lets warm runs re-check only what changed
             result = subprocess.run(
-                ['npx', 'tsc', '--noEmit', '--pretty'],
+                [
+                    'npx', 'tsc', '--noEmit', '--pretty',
+                    '--incremental',
+                    '--tsBuildInfoFile', os.path.join(state_dir, f'tsc-{key}.tsbuildinfo'),
+                ],
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=TSC_TIMEOUT,
                 cwd=project_dir,
             )
 
@@ -61,6 +96,11 @@ def main():
 
         except (FileNotFoundError, subprocess.TimeoutExpired):
             pass
+        finally:
+            try:
+                os.remove(lock_file)
+            except OSError:
+                pass
 
     except Exception:
         pass
@@ -7,6 +7,7 @@ import json
 import os
 import shutil
 import sys
+import time
 
 
 def check_environment():
@@ -49,8 +50,29 @@ def check_environment():
     return info, warnings
 
 
+def record_session_start(session_id):
+    """Record when this session started, for suggest-doc-updates' change scan."""
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    session_file = os.path.join(project_dir, ".claude", "session.json")
+    try:
+        os.makedirs(os.path.dirname(session_file), exist_ok=True)
+        with open(session_file, "w") as f:
+            json.dump({"session_id": session_id, "start": time.time()}, f)
+    except OSError:
+        pass
+
+
 def main():
     try:
+        try:
+            input_data = json.loads(sys.stdin.buffer.read())
+        except Exception:
+            input_data = {}
+
+        session_id = input_data.get("session_id")
+        if session_id:
+            record_session_start(session_id)
+
         info, warnings = check_environment()
 
         # Print environment status
@@ -52,7 +52,7 @@ def validate_prompt(prompt):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         prompt = input_data.get("prompt", "")
 
         if not prompt: